@@ -1,6 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import csv
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from importlib.resources import files
 
@@ -52,6 +58,471 @@ class AddRowDialog:
     def cancel(self):
         self.dialog.destroy()
 
+class ColumnPickerDialog:
+    def __init__(self, parent, headers):
+        self.result = None
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Load Columns")
+        self.dialog.geometry("300x400")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+
+        # Center the dialog
+        self.dialog.geometry("+%d+%d" % (
+            parent.winfo_rootx() + parent.winfo_width()/2 - 150,
+            parent.winfo_rooty() + parent.winfo_height()/2 - 200))
+
+        # Add explanation label
+        ttk.Label(self.dialog, text=f"This file has {len(headers)} columns. Select the columns to load; "
+                  "the others stay on disk until you show them.",
+                 wraplength=250).pack(pady=10)
+
+        # Add column list
+        list_frame = ttk.Frame(self.dialog)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox = tk.Listbox(list_frame, selectmode=tk.EXTENDED, yscrollcommand=scrollbar.set,
+                                  exportselection=False)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.listbox.yview)
+        for header in headers:
+            self.listbox.insert(tk.END, header)
+
+        # Add buttons
+        button_frame = ttk.Frame(self.dialog)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text="Load Selected", command=self.ok).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Load All", command=self.cancel).pack(side=tk.LEFT)
+
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.dialog.bind("<Return>", lambda e: self.ok())
+        self.dialog.bind("<Escape>", lambda e: self.cancel())
+
+    def ok(self):
+        selection = list(self.listbox.curselection())
+        if not selection:
+            messagebox.showerror("Error", "Please select at least one column")
+            return
+        self.result = selection
+        self.dialog.destroy()
+
+    def cancel(self):
+        self.dialog.destroy()
+
+class CSVSource:
+    """Byte-level access to the CSV file that projected rows were loaded from.
+
+    Only the projected columns are parsed at load time. Every row keeps the
+    byte range of its record, and the other columns are re-derived from the
+    file when they are read. The file handle is shared with the save thread,
+    so all reads go through the lock.
+    """
+    # files wider than this offer to load a subset of the columns
+    PICK_COLUMNS_THRESHOLD = 20
+    # saves write in pieces about this big; unchanged rows take the lock once per piece
+    COPY_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = columns
+        self.slots = {col: slot for slot, col in enumerate(columns)}
+        self.lock = threading.Lock()
+        self.file = None
+        # rows written on save end like the source's header, so copied rows match
+        self.lineterminator = "\r\n"
+        # the display reads one row at a time, so caching the last parsed record is enough
+        self.cached_span = None
+        self.cached_fields = None
+
+    @staticmethod
+    def read_headers(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return next(csv.reader(f), [])
+
+    @staticmethod
+    def in_quotes_after(line, in_quotes):
+        """
+        Tell whether a quoted field is still open at the end of the line.
+        Like csv, a quote only opens a field at its start; elsewhere it is a literal.
+        """
+        i = 0
+        at_field_start = not in_quotes
+        while i < len(line):
+            if in_quotes:
+                end = line.find(b'"', i)
+                if end == -1:
+                    return True
+                if line[end + 1:end + 2] == b'"':
+                    i = end + 2
+                else:
+                    in_quotes = False
+                    at_field_start = False
+                    i = end + 1
+            elif at_field_start and line[i:i + 1] == b'"':
+                in_quotes = True
+                i += 1
+            else:
+                comma = line.find(b",", i)
+                if comma == -1:
+                    break
+                at_field_start = True
+                i = comma + 1
+        return in_quotes
+
+    @classmethod
+    def records(cls, f):
+        """Yield (start, end, data) for every record, keeping quoted newlines inside their record."""
+        pos = 0
+        start = 0
+        parts = []
+        in_quotes = False
+        for line in f:
+            parts.append(line)
+            pos += len(line)
+            if in_quotes or b'"' in line:
+                in_quotes = cls.in_quotes_after(line, in_quotes)
+            if not in_quotes:
+                yield start, pos, b"".join(parts)
+                start = pos
+                parts = []
+        if parts:
+            yield start, pos, b"".join(parts)
+
+    @staticmethod
+    def parse(data):
+        return next(csv.reader([data.decode('utf-8')]), [])
+
+    def load(self):
+        """Read the header and the projected columns of every row."""
+        rows = []
+        last_col = max(self.columns)
+        with open(self.path, 'rb') as f:
+            records = self.records(f)
+            header = next(records, None)
+            headers = self.parse(header[2]) if header else []
+            if header and header[2].endswith(b"\n") and not header[2].endswith(b"\r\n"):
+                self.lineterminator = "\n"
+            for start, end, data in records:
+                if b'"' in data:
+                    fields = self.parse(data)
+                else:
+                    # unquoted records only need splitting up to the last projected column
+                    fields = data.rstrip(b"\r\n").split(b",", last_col + 1)
+                    fields = [field.decode('utf-8') for field in fields[:last_col + 1]]
+                values = [fields[col] if col < len(fields) else '' for col in self.columns]
+                rows.append(ProjectedRow(self, [start, end], values))
+        return headers, rows
+
+    def read(self, start, end):
+        with self.lock:
+            return self.read_locked(start, end)
+
+    def read_locked(self, start, end):
+        if self.file is None:
+            self.file = open(self.path, 'rb')
+        self.file.seek(start)
+        return self.file.read(end - start)
+
+    def fields(self, span):
+        with self.lock:
+            if self.cached_span != span:
+                self.cached_fields = self.parse(self.read_locked(span[0], span[1]))
+                self.cached_span = list(span)
+            return self.cached_fields
+
+    def replace(self, tmp_filename, filename, new_spans):
+        """Move a saved file into place and point the saved rows at their records in it."""
+        with self.lock:
+            self.close_locked()
+            os.replace(tmp_filename, filename)
+            self.path = filename
+            self.cached_span = None
+            for row, start, end in new_spans:
+                row.span[0] = start
+                row.span[1] = end
+                row.dirty = False
+
+    def close(self):
+        with self.lock:
+            self.close_locked()
+
+    def close_locked(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class ProjectedRow:
+    """A row that holds only its projected columns plus edits, and reads the rest from its source.
+
+    Copies share the span list, so re-pointing a row after a save also moves
+    the copies taken while the save was running.
+    """
+    __slots__ = ("source", "span", "values", "edits", "dirty")
+
+    def __init__(self, source, span, values, edits=None, dirty=False):
+        self.source = source
+        self.span = span
+        self.values = values
+        self.edits = edits
+        self.dirty = dirty
+
+    def __getitem__(self, col):
+        if self.edits and col in self.edits:
+            return self.edits[col]
+        slot = self.source.slots.get(col)
+        if slot is not None:
+            return self.values[slot]
+        fields = self.source.fields(self.span)
+        return fields[col] if col < len(fields) else ''
+
+    def __setitem__(self, col, value):
+        slot = self.source.slots.get(col)
+        if slot is not None:
+            self.values[slot] = value
+        else:
+            if self.edits is None:
+                self.edits = {}
+            self.edits[col] = value
+        self.dirty = True
+
+    def __iter__(self):
+        fields = list(self.source.fields(self.span))
+        width = max([len(fields), max(self.source.columns) + 1] + [col + 1 for col in self.edits or ()])
+        fields.extend([''] * (width - len(fields)))
+        for col in self.source.columns:
+            fields[col] = self.values[self.source.slots[col]]
+        for col, value in (self.edits or {}).items():
+            fields[col] = value
+        return iter(fields)
+
+    def copy(self):
+        return ProjectedRow(self.source, self.span, list(self.values),
+                            dict(self.edits) if self.edits else None, self.dirty)
+
+class EditJournal:
+    """Append-only sidecar log of the edits made since the file was last saved.
+
+    Each edit is written as one JSON line next to the CSV file. The log is
+    flushed on every append and fsync'ed at most every FSYNC_INTERVAL seconds.
+    A journal that is still on disk when a file is opened means the previous
+    session did not exit cleanly, and its records can be replayed. Each set of
+    records put aside for a save is sealed with the inode, size and mtime of
+    the file it applies to, so it is skipped if that save landed after all.
+    """
+    SUFFIX = ".goocsv-journal"
+    FSYNC_INTERVAL = 1.0
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.path = filename + self.SUFFIX
+        # edits logged before an in-flight save started live here until the save lands
+        self.saving_path = self.path + ".saving"
+        self.file = None
+        self.dirty = False
+        self.last_sync = time.monotonic()
+
+    def exists(self):
+        return os.path.exists(self.path) or os.path.exists(self.saving_path)
+
+    def base(self):
+        """Identify the current version of the journaled file."""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return {"op": "base", "ino": None, "size": None, "mtime_ns": None}
+        # os.replace always gives the saved file a new inode, even when size and mtime match
+        return {"op": "base", "ino": stat.st_ino, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def read(self, path):
+        """Yield the records of one journal file, stopping at a torn last line."""
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    break
+
+    def saving_segments(self):
+        """Yield (records, base) for each set of records put aside by a save."""
+        records = []
+        for record in self.read(self.saving_path):
+            if record["op"] == "base":
+                yield records, record
+                records = []
+            else:
+                records.append(record)
+        if records:
+            # the seal was torn off; the records were never part of a save
+            yield records, None
+
+    def records(self):
+        """Yield the edit records that still apply to the file, in order."""
+        base = self.base()
+        for records, segment_base in self.saving_segments():
+            # a save that replaced the file but did not get to drop its records already contains them
+            if segment_base is None or segment_base == base:
+                yield from records
+        yield from self.read(self.path)
+
+    def prune(self):
+        """Drop the put-aside records that already landed in the file, so they are not offered again."""
+        if not os.path.exists(self.saving_path):
+            return
+        base = self.base()
+        kept = [segment for segment in self.saving_segments()
+                if segment[1] is None or segment[1] == base]
+        if not kept:
+            os.remove(self.saving_path)
+            return
+        tmp_path = self.saving_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for records, segment_base in kept:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+                f.write(json.dumps(segment_base or base) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.saving_path)
+
+    def open(self):
+        if self.file is None:
+            self.file = open(self.path, 'a', encoding='utf-8')
+
+    def append(self, record):
+        self.open()
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        self.dirty = True
+        if time.monotonic() - self.last_sync >= self.FSYNC_INTERVAL:
+            self.sync()
+
+    def sync(self):
+        if self.file is not None and self.dirty:
+            os.fsync(self.file.fileno())
+            self.dirty = False
+        self.last_sync = time.monotonic()
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def begin_save(self):
+        """Set aside the records covered by the snapshot being saved and start a fresh log."""
+        self.close()
+        self.prune()
+        if not os.path.exists(self.path):
+            return
+        self.append(self.base())
+        self.close()
+        if os.path.exists(self.saving_path):
+            # a previous save failed; keep its records ahead of the newer ones
+            with open(self.path, 'r', encoding='utf-8') as src, \
+                    open(self.saving_path, 'a', encoding='utf-8') as dst:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self.path)
+        else:
+            os.replace(self.path, self.saving_path)
+
+    def end_save(self):
+        """Drop the records that are now part of the saved file."""
+        if os.path.exists(self.saving_path):
+            os.remove(self.saving_path)
+
+    def discard(self):
+        self.close()
+        for path in (self.saving_path, self.path):
+            if os.path.exists(path):
+                os.remove(path)
+
+class EditHistory:
+    """Bounded undo/redo history of compact edit operations.
+
+    Entries are tuples holding just what changed:
+    ("set", row, col, old, new), ("insert", row) and
+    ("bulk", ((row, col, old, new), ...)). Consecutive edits of the same cell
+    within MERGE_INTERVAL seconds are merged into one entry, and the oldest
+    entries are dropped once the history grows past MAX_BYTES.
+    """
+    MAX_BYTES = 16 * 1024 * 1024
+    MERGE_INTERVAL = 1.0
+    ENTRY_OVERHEAD = 64
+
+    def __init__(self):
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.size = 0
+        self.last_record_time = 0
+        self.can_merge = False
+
+    @classmethod
+    def entry_size(cls, entry):
+        if entry[0] == "set":
+            return cls.ENTRY_OVERHEAD + len(entry[3]) + len(entry[4])
+        if entry[0] == "bulk":
+            return cls.ENTRY_OVERHEAD + sum(
+                cls.ENTRY_OVERHEAD + len(old) + len(new) for _, _, old, new in entry[1])
+        return cls.ENTRY_OVERHEAD
+
+    def record(self, entry):
+        """Add a new user edit, merging it into the previous one when it continues typing."""
+        now = time.monotonic()
+        self.redo_stack.clear()
+        top = self.undo_stack[-1] if self.undo_stack else None
+        if (self.can_merge and entry[0] == "set" and top is not None and top[0] == "set"
+                and top[1:3] == entry[1:3] and now - self.last_record_time < self.MERGE_INTERVAL):
+            self.undo_stack.pop()
+            self.size -= self.entry_size(top)
+            entry = ("set", entry[1], entry[2], top[3], entry[4])
+        self.push_undo(entry)
+        self.last_record_time = now
+        self.can_merge = True
+
+    def push_undo(self, entry):
+        self.undo_stack.append(entry)
+        self.size += self.entry_size(entry)
+        while self.size > self.MAX_BYTES and len(self.undo_stack) > 1:
+            self.size -= self.entry_size(self.undo_stack.popleft())
+
+    def peek_undo(self):
+        return self.undo_stack[-1] if self.undo_stack else None
+
+    def peek_redo(self):
+        return self.redo_stack[-1] if self.redo_stack else None
+
+    def pop_undo(self):
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        self.size -= self.entry_size(entry)
+        self.redo_stack.append(entry)
+        self.can_merge = False
+        return entry
+
+    def pop_redo(self):
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        self.push_undo(entry)
+        self.can_merge = False
+        return entry
+
+    def break_merge(self):
+        """Make the next edit start a new entry instead of extending the last one."""
+        self.can_merge = False
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.size = 0
+        self.can_merge = False
+
 class CSVEditorApp:
     def __init__(self, master):
         self.master = master
@@ -65,6 +536,12 @@ class CSVEditorApp:
         self.current_row_values = []
         self.texts = []
         self.search_popup_on = False
+        self.journal = None
+        self.history = EditHistory()
+        self.source = None
+        self.save_job = None
+        # rows copied since the save snapshot was taken, so they can be edited in place
+        self.cow_rows = set()
         
         # Configure style
         self.style = ttk.Style()
@@ -77,6 +554,11 @@ class CSVEditorApp:
         
         # Create sample data
         self.create_sample_data()
+        self.journal = EditJournal(self.filename)
+        if self.journal.exists() and os.path.exists(self.filename):
+            # the interrupted session had already saved the untitled document
+            self.load_csv()
+        self.recover_journal()
         self.create_widgets()
         self.update_data_display()
 
@@ -90,6 +572,7 @@ class CSVEditorApp:
         self.context_menu.add_command(label="Paste", command=self.menu_paste)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Undo", command=self.menu_undo)
+        self.context_menu.add_command(label="Redo", command=self.menu_redo)
         self.context_menu.add_command(label="Delete", command=self.menu_delete)
 
         # Bind left-click on master to hide the context menu
@@ -97,36 +580,45 @@ class CSVEditorApp:
    
         # When window lost focus, hide the context menu
         self.master.bind("<FocusOut>", lambda e: self.context_menu.unpost())
+
+        self.master.after(int(EditJournal.FSYNC_INTERVAL * 1000), self.sync_journal)
+
+        # Wait for a running save and clean up the journal when the window is closed
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def on_close(self):
+        saved = True
         if self.modified:
             if messagebox.askyesno("Save Changes", "Do you want to save changes to the current file?"):
-                self.save_changes()
+                saved = self.save_changes()
+        # keep the journal if the save failed; it is the only copy of the edits now
+        saved = self.wait_for_save() and saved
+        if self.journal and saved:
+            self.journal.discard()
+        if self.source:
+            self.source.close()
         self.master.destroy()
-    
-    def map_visible_idx_to_col_idx(self, col_idx):
-        """Map the visible column index to the actual column index in the data."""
-        # find the pair from self.column_visibility that is the col_idx+1 th visible
-        col_idx_converted = 0
-        for i, visible in enumerate(self.column_visibility):
-            if visible:
-                if col_idx_converted == col_idx:
-                    return i
-                col_idx_converted += 1
-        return -1
 
+    def sync_journal(self):
+        """Periodically fsync the edit journal so idle edits reach the disk too."""
+        if self.journal:
+            self.journal.sync()
+        self.master.after(int(EditJournal.FSYNC_INTERVAL * 1000), self.sync_journal)
+    
     def show_context_menu(self, event):
         """Show the shared context menu at the right-click location."""
         self.current_context_entry = event.widget
         self.context_menu.post(event.x_root, event.y_root)
 
     def handle_undo(self, event):
-        """Revert the text widget to its original value."""
-        widget = event.widget
-        col_idx = widget.col_idx
-        original_value = self.current_row_values[self.map_visible_idx_to_col_idx(col_idx)]
-        widget.delete("1.0", tk.END)
-        widget.insert(tk.END, original_value)
+        """Undo the last edit, wherever it was made."""
+        self.undo()
+        return "break"
+
+    def handle_redo(self, event):
+        """Redo the last undone edit."""
+        self.redo()
+        return "break"
 
     def menu_select_all(self):
         if hasattr(self, 'current_context_entry') and self.current_context_entry:
@@ -162,11 +654,10 @@ class CSVEditorApp:
             self.current_context_entry.delete("1.0", tk.END)
 
     def menu_undo(self):
-        if hasattr(self, 'current_context_entry') and self.current_context_entry:
-            col_idx = self.current_context_entry.col_idx
-            original_value = self.current_row_values[self.map_visible_idx_to_col_idx(col_idx)]
-            self.current_context_entry.delete("1.0", tk.END)
-            self.current_context_entry.insert(tk.END, original_value)
+        self.undo()
+
+    def menu_redo(self):
+        self.redo()
 
     def create_sample_data(self):
         self.headers = ["Name", "Age", "City", "Occupation"]
@@ -186,12 +677,11 @@ class CSVEditorApp:
         self.master.wait_window(dialog.dialog)
         
         if dialog.result is not None:
-            new_row = [''] * len(self.headers)
             insert_position = dialog.result
             
             # Insert at the specified position
             if insert_position == 0:
-                self.rows.insert(0, new_row)
+                self.apply_edit({"op": "insert", "row": 0})
                 self.current_row = 0
             else:
                 # Ensure we don't exceed the list bounds
@@ -205,7 +695,7 @@ class CSVEditorApp:
                     return
 
                 # insert_position = min(insert_position, len(self.rows))
-                self.rows.insert(insert_position, new_row)
+                self.apply_edit({"op": "insert", "row": insert_position})
                 self.current_row = insert_position
             
             self.modified = True
@@ -222,8 +712,12 @@ class CSVEditorApp:
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         if new_filename:
+            if self.journal:
+                self.journal.discard()
             self.filename = new_filename
+            self.journal = EditJournal(self.filename)
             self.master.title(f"GoofyCSVEdit - {self.filename}")
+            columns = self.pick_columns()
             
             # Clear existing interface
             if self.main_frame:
@@ -235,14 +729,44 @@ class CSVEditorApp:
             self.headers = []
             self.rows = []
             self.column_visibility = []
+            self.history.clear()
+            if self.source:
+                self.source.close()
+                self.source = None
             
             # Load and create new interface
-            self.load_csv()
+            self.load_csv(columns)
+            self.recover_journal()
             self.create_widgets()
             self.update_data_display()
     
-    def load_csv(self):
+    def pick_columns(self):
+        """Ask which columns to load when the file is wide. Return None to load all of them."""
+        try:
+            headers = CSVSource.read_headers(self.filename)
+        except (OSError, UnicodeDecodeError, csv.Error):
+            return None
+        if len(headers) <= CSVSource.PICK_COLUMNS_THRESHOLD:
+            return None
+        dialog = ColumnPickerDialog(self.master, headers)
+        self.master.wait_window(dialog.dialog)
+        return dialog.result
+
+    def load_csv(self, columns=None):
+        """
+        Load the file. With columns given, only those columns are parsed and shown;
+        the others are read back from the file when they are made visible.
+        """
         try:
+            if columns:
+                try:
+                    self.source = CSVSource(self.filename, columns)
+                    self.headers, self.rows = self.source.load()
+                    self.column_visibility = [col in self.source.slots for col in range(len(self.headers))]
+                    return
+                except (csv.Error, UnicodeDecodeError):
+                    # records the projected loader cannot split; read the whole file instead
+                    self.source = None
             with open(self.filename, 'r', encoding='utf-8') as f:
                 reader = csv.reader(f)
                 self.headers = next(reader, [])
@@ -253,6 +777,25 @@ class CSVEditorApp:
             self.rows = []
             self.column_visibility = [True]
             self.modified = True
+
+    def recover_journal(self):
+        """Offer to replay edits left in the journal by a session that did not exit cleanly."""
+        self.journal.prune()
+        if not self.journal.exists():
+            return
+        if not messagebox.askyesno(
+            "Recover Edits",
+            "Unsaved edits from a previous session were found for this file. Recover them?"
+        ):
+            self.journal.discard()
+            return
+        for record in self.journal.records():
+            try:
+                self.apply_edit(record, log=False, track=False)
+            except (IndexError, KeyError, TypeError):
+                # the journal does not match this file any more; keep what applied cleanly
+                break
+        self.modified = True
     
     def create_widgets(self):
         # Main container
@@ -324,9 +867,12 @@ class CSVEditorApp:
         self.change_row(0)
 
     def open_new_file(self):
+        saved = True
         if self.modified:
             if messagebox.askyesno("Save Changes", "Do you want to save changes to the current file?"):
-                self.save_changes()
+                saved = self.save_changes()
+        if not (self.wait_for_save() and saved):
+            return
         self.open_file()
     
     def update_column_headers(self):
@@ -384,7 +930,6 @@ class CSVEditorApp:
             entry = tk.Text(col_frame, wrap=tk.WORD, yscrollcommand=scrollbar.set, width=100000)
             entry.insert(tk.END, row_data[data_col])
             entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            entry.col_idx = col_idx
 
             self.texts.append(entry)
 
@@ -408,6 +953,8 @@ class CSVEditorApp:
             entry.bind('<Control-a>', self.select_all)
             
             entry.bind('<Control-z>', self.handle_undo)
+            entry.bind('<Control-y>', self.handle_redo)
+            entry.bind('<Control-Z>', self.handle_redo)
             # Bind Ctrl+H to show search popup
             entry.bind('<Control-f>', self.show_search_popup)
 
@@ -420,14 +967,6 @@ class CSVEditorApp:
         self.data_frame.rowconfigure(0, weight=1)
         self.row_label.config(text=f"Row {self.current_row + 1} of {len(self.rows)}")
 
-    def handle_undo(self, event):
-        """Revert the text widget to its original value."""
-        widget = event.widget
-        col_idx = widget.col_idx
-        original_value = self.current_row_values[self.map_visible_idx_to_col_idx(col_idx)]
-        widget.delete("1.0", tk.END)
-        widget.insert(tk.END, original_value)
-
     def show_search_popup(self, event):
         if self.search_popup_on:
             return
@@ -597,28 +1136,13 @@ class CSVEditorApp:
         If delta is 0, update current row values only.
         """
         if 0 <= self.current_row + delta < len(self.rows):
-            # check if content is the same
-            old_row_content = self.current_row_values
-            new_row_content = self.rows[self.current_row]
-            diff = False
-            for i in range(len(old_row_content)):
-                if old_row_content[i] != new_row_content[i]:
-                    diff = True
-                    break
-            if diff and delta != 0:
-                val = messagebox.askyesnocancel(
-                    "Warning", 
-                    f"Confirm to override the current row content and move on?"
-                )
-                if val == False: # revert values and move on
-                    for idx in range(len(self.current_row_values)):
-                        self.update_cell_data(idx, self.current_row_values[idx])
-                    self.update_data_display()
-                elif val == None: # stay
-                    return
+            if delta != 0 and not self.confirm_leave_row():
+                return
             
             self.row_label.config(text=f"Row {self.current_row + 1} of {len(self.rows)}")
             self.current_row += delta
+            if delta != 0:
+                self.history.break_merge()
 
             row_data = self.rows[self.current_row]
             self.current_row_values = []
@@ -635,30 +1159,296 @@ class CSVEditorApp:
             else:
                 messagebox.showinfo("Info", f"Row {self.current_row + 1} is out of bounds")
 
+    def confirm_leave_row(self, track=True):
+        """
+        Ask before leaving a row whose content changed since it was entered.
+        Return False if the user chose to stay.
+        """
+        if not self.rows:
+            return True
+        # check if content is the same
+        old_row_content = self.current_row_values
+        new_row_content = self.rows[self.current_row]
+        diff = False
+        for i in range(len(old_row_content)):
+            if old_row_content[i] != new_row_content[i]:
+                diff = True
+                break
+        if diff:
+            val = messagebox.askyesnocancel(
+                "Warning", 
+                f"Confirm to override the current row content and move on?"
+            )
+            if val == False: # revert values and move on
+                self.update_cells([(self.current_row, idx, value)
+                                   for idx, value in enumerate(self.current_row_values)], track)
+                self.update_data_display()
+            elif val == None: # stay
+                return False
+        return True
+
     def update_cell_data(self, col, value):
-        self.rows[self.current_row][col] = value
+        if self.rows[self.current_row][col] == value:
+            return
+        self.apply_edit({"op": "set", "row": self.current_row, "col": col, "value": value})
+
+    def update_cells(self, cells, track=True):
+        """Apply a bulk edit of (row, col, value) triples as one journal record."""
+        cells = [[row, col, value] for row, col, value in cells
+                 if self.rows[row][col] != value]
+        if cells:
+            self.apply_edit({"op": "bulk", "cells": cells}, track=track)
+
+    def apply_edit(self, record, log=True, track=True):
+        """Apply one edit record to the document, journal it and add it to the undo history."""
+        op = record["op"]
+        if op == "set":
+            row = self.writable_row(record["row"])
+            entry = ("set", record["row"], record["col"], row[record["col"]], record["value"])
+            row[record["col"]] = record["value"]
+        elif op == "bulk":
+            cells = []
+            for row_idx, col, value in record["cells"]:
+                row = self.writable_row(row_idx)
+                cells.append((row_idx, col, row[col], value))
+                row[col] = value
+            entry = ("bulk", tuple(cells))
+        elif op == "insert":
+            new_row = [''] * len(self.headers)
+            self.rows.insert(record["row"], new_row)
+            self.cow_rows.add(id(new_row))
+            entry = ("insert", record["row"])
+        elif op == "delete":
+            del self.rows[record["row"]]
+            entry = None
+        if log and self.journal:
+            self.journal.append(record)
+        if track and entry is not None:
+            self.history.record(entry)
         self.modified = True
 
+    def undo(self):
+        entry = self.history.peek_undo()
+        if entry is None:
+            self.status_bar.config(text="Nothing to undo")
+            return
+        moved = self.leave_row_for(entry)
+        if moved is None:
+            return
+        self.history.pop_undo()
+        if entry[0] == "set":
+            _, row, col, old, _ = entry
+            self.apply_edit({"op": "set", "row": row, "col": col, "value": old}, track=False)
+        elif entry[0] == "bulk":
+            cells = [[row, col, old] for row, col, old, _ in reversed(entry[1])]
+            self.apply_edit({"op": "bulk", "cells": cells}, track=False)
+            row, col = cells[-1][0], cells[-1][1]
+        elif entry[0] == "insert":
+            row, col = entry[1], None
+            self.apply_edit({"op": "delete", "row": row}, track=False)
+            row = min(row, len(self.rows) - 1)
+        self.show_edit(row, col, moved)
+
+    def redo(self):
+        entry = self.history.peek_redo()
+        if entry is None:
+            self.status_bar.config(text="Nothing to redo")
+            return
+        moved = self.leave_row_for(entry)
+        if moved is None:
+            return
+        self.history.pop_redo()
+        if entry[0] == "set":
+            _, row, col, _, new = entry
+            self.apply_edit({"op": "set", "row": row, "col": col, "value": new}, track=False)
+        elif entry[0] == "bulk":
+            cells = [[row, col, new] for row, col, _, new in entry[1]]
+            self.apply_edit({"op": "bulk", "cells": cells}, track=False)
+            row, col = cells[0][0], cells[0][1]
+        elif entry[0] == "insert":
+            row, col = entry[1], None
+            self.apply_edit({"op": "insert", "row": row}, track=False)
+        self.show_edit(row, col, moved)
+
+    def leave_row_for(self, entry):
+        """
+        Tell whether undoing/redoing the entry moves to another row, confirming the move like change_row.
+        Return None if the user chose to stay.
+        """
+        if entry[0] == "bulk":
+            row = entry[1][0][0]
+        else:
+            row = entry[1]
+        # inserting or deleting a row always changes which row sits at the current index
+        moved = entry[0] == "insert" or row != self.current_row
+        # a revert here is not recorded, so it cannot end up as the entry being undone
+        if moved and not self.confirm_leave_row(track=False):
+            return None
+        return moved
+
+    def show_edit(self, row, col, moved):
+        """Show the row touched by an undo/redo and focus the cell if it is visible."""
+        if moved:
+            self.history.break_merge()
+            self.current_row = max(row, 0)
+            self.current_row_values = list(self.rows[self.current_row]) if self.rows else []
+        self.update_data_display()
+        if col is not None and self.column_visibility[col]:
+            entry = self.texts[sum(self.column_visibility[:col])]
+            entry.focus_set()
+            entry.mark_set(tk.INSERT, tk.END)
+
+    def writable_row(self, row_idx):
+        """Return the row list, copying it first if an in-flight save still shares it."""
+        row = self.rows[row_idx]
+        if self.save_job is not None and id(row) not in self.cow_rows:
+            row = row.copy()
+            self.rows[row_idx] = row
+            self.cow_rows.add(id(row))
+        return row
+
     def save_changes(self):
+        """
+        Start saving in the background. Return False if the save could not be started;
+        wait_for_save tells whether the save itself succeeded.
+        """
         if not self.filename:
             self.filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
             )
         if not self.filename:
-            return
-            
+            return False
+        if self.journal is None or self.journal.filename != self.filename:
+            self.journal = EditJournal(self.filename)
+
+        # only one save at a time; the newer snapshot supersedes the running one
+        self.wait_for_save()
         try:
             # call change row 0 to update saved row values, so no pop up dialog
             self.change_row(0)
-            with open(self.filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(self.headers)
-                writer.writerows(self.rows)
-            self.modified = False
-            self.status_bar.config(text=f"File saved successfully at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            if self.journal:
+                self.journal.begin_save()
         except Exception as e:
             messagebox.showerror("Save Error", str(e))
+            return False
+
+        # the snapshot shares row lists with the document; edits copy a row before touching it
+        job = {
+            "filename": self.filename,
+            "journal": self.journal,
+            "source": self.source,
+            "headers": list(self.headers),
+            "rows": list(self.rows),
+            "error": None,
+        }
+        job["thread"] = threading.Thread(target=self.write_snapshot, args=(job,), daemon=True)
+        self.save_job = job
+        self.cow_rows = set()
+        self.modified = False
+        self.status_bar.config(text="Saving...")
+        job["thread"].start()
+        self.master.after(100, self.poll_save)
+        return True
+
+    def write_snapshot(self, job):
+        """
+        Write a save snapshot to disk. Runs on the background save thread.
+        Unchanged projected rows are copied from the source file byte for byte.
+        """
+        tmp_filename = job["filename"] + ".tmp"
+        source = job["source"]
+        try:
+            new_spans = []
+            with open(tmp_filename, 'wb') as f:
+                text = io.StringIO()
+                lineterminator = source.lineterminator if source else "\r\n"
+                writer = csv.writer(text, lineterminator=lineterminator)
+                writer.writerow(job["headers"])
+                # run of unchanged projected rows that are contiguous in the source file
+                run_start = run_end = None
+                run_rows = []
+
+                def flush_text():
+                    f.write(text.getvalue().encode('utf-8'))
+                    text.seek(0)
+                    text.truncate()
+
+                def flush_run():
+                    offset = f.tell() - run_start
+                    for row in run_rows:
+                        new_spans.append((row, row.span[0] + offset, row.span[1] + offset))
+                    data = b""
+                    for start in range(run_start, run_end, CSVSource.COPY_CHUNK_SIZE):
+                        data = source.read(start, min(start + CSVSource.COPY_CHUNK_SIZE, run_end))
+                        f.write(data)
+                    if not data.endswith(b"\n"):
+                        f.write(lineterminator.encode('utf-8'))
+                    run_rows.clear()
+
+                for row in job["rows"]:
+                    if isinstance(row, ProjectedRow) and not row.dirty:
+                        if run_rows and row.span[0] == run_end:
+                            run_end = row.span[1]
+                        else:
+                            if run_rows:
+                                flush_run()
+                            flush_text()
+                            run_start, run_end = row.span
+                        run_rows.append(row)
+                        continue
+                    if run_rows:
+                        flush_run()
+                    if isinstance(row, ProjectedRow):
+                        flush_text()
+                        start = f.tell()
+                        writer.writerow(row)
+                        flush_text()
+                        new_spans.append((row, start, f.tell()))
+                    else:
+                        writer.writerow(row)
+                        if text.tell() >= CSVSource.COPY_CHUNK_SIZE:
+                            flush_text()
+                if run_rows:
+                    flush_run()
+                flush_text()
+                f.flush()
+                os.fsync(f.fileno())
+            if source:
+                source.replace(tmp_filename, job["filename"], new_spans)
+            else:
+                os.replace(tmp_filename, job["filename"])
+            if job["journal"]:
+                job["journal"].end_save()
+        except Exception as e:
+            job["error"] = e
+
+    def poll_save(self):
+        job = self.save_job
+        if job is None:
+            return
+        if job["thread"].is_alive():
+            self.master.after(100, self.poll_save)
+        else:
+            self.finish_save(job)
+
+    def wait_for_save(self):
+        """Block until the running save (if any) is done. Return False if it failed."""
+        job = self.save_job
+        if job is None:
+            return True
+        job["thread"].join()
+        return self.finish_save(job)
+
+    def finish_save(self, job):
+        self.save_job = None
+        self.cow_rows = set()
+        if job["error"] is not None:
+            self.modified = True
+            messagebox.showerror("Save Error", str(job["error"]))
+            return False
+        self.status_bar.config(text=f"File saved successfully at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        return True
 
     def about(self):
         about_window = tk.Toplevel(self.master)